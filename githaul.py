@@ -36,14 +36,22 @@
 #   DESYNCHRONIZED- Both dirty & behind
 
 import argparse
+import functools
+import json
 import subprocess
 import sys
 import os
 import pathlib
+import urllib.parse
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from typing import List, Dict, Tuple, Optional
 from rich.console import Console
+from rich.live import Live
+from rich.progress import Progress
 from rich.table import Table
 from rich import box
 
@@ -64,6 +72,20 @@ def run_command(cmd: List[str], cwd: Optional[str] = None, timeout: int = 40) ->
     except Exception as e:
         return 99, "", str(e)
 
+def run_command_bool(cmd: List[str], cwd: Optional[str] = None, timeout: int = 40) -> bool:
+    """Run a command, report only whether it produced any stdout.
+
+    Fast variant for "is the output empty?" checks: leaves stdout as bytes
+    (no UTF-8 decode) and discards stderr instead of capturing it.
+    """
+    try:
+        proc = subprocess.run(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=cwd, timeout=timeout
+        )
+        return bool(proc.stdout.strip())
+    except Exception:
+        return False
+
 def parse_org_user_alias(arg: str) -> Tuple[Optional[str], str, str]:
     """
     Parse '[<github-org>:]<github-user>@<github-host-alias>'
@@ -81,9 +103,33 @@ def parse_org_user_alias(arg: str) -> Tuple[Optional[str], str, str]:
         fatal("Parsing failed: user or alias missing")
     return org, user, alias
 
+def ssh_multiplex_options() -> List[str]:
+    """SSH options that share one multiplexed connection across all git calls.
+
+    The auth check below opens the master connection; ControlPersist keeps
+    it alive for 10 minutes so every subsequent git fetch/clone/ls-remote
+    skips its own TCP+SSH handshake (~100-300ms each).
+    """
+    ssh_dir = pathlib.Path("~/.ssh").expanduser()
+    try:
+        ssh_dir.mkdir(mode=0o700, exist_ok=True)
+    except OSError:
+        # No usable ~/.ssh: multiplexing is an optimization, not a requirement.
+        return []
+    return [
+        "-o", "ControlMaster=auto",
+        "-o", f"ControlPath={ssh_dir}/githaul-cm-%C",
+        "-o", "ControlPersist=600",
+    ]
+
 def verify_ssh_access(user: str, alias: str) -> None:
-    """SSH authentication check as git@<alias> for user <user>."""
-    cmd = ["ssh", "-T", f"git@{alias}"]
+    """SSH authentication check as git@<alias> for user <user>.
+
+    Also exports GIT_SSH_COMMAND so every later git subprocess reuses the
+    multiplexed connection this check establishes.
+    """
+    mux_opts = ssh_multiplex_options()
+    cmd = ["ssh", "-T"] + mux_opts + [f"git@{alias}"]
     code, out, err = run_command(cmd, timeout=12)
     expected = f"Hi {user}! You've successfully authenticated, but GitHub does not provide shell access."
     found = None
@@ -94,6 +140,8 @@ def verify_ssh_access(user: str, alias: str) -> None:
     if not found:
         details = f"SSH returned code {code}\nSTDOUT:\n{out}\nSTDERR:\n{err}"
         fatal(f"SSH authentication failed or wrong user/alias:\n{details}")
+    if mux_opts:
+        os.environ["GIT_SSH_COMMAND"] = "ssh " + " ".join(mux_opts)
     console.print(
         f"[green]SSH authentication to {alias} verified for user {user} (message in {found})[/green]"
     )
@@ -107,147 +155,476 @@ def check_local_path(path: str) -> pathlib.Path:
         fatal(f"Local path '{p}' is not writable")
     return p
 
+# One pooled Session for every GitHub API call: TCP+TLS connections are
+# reused across pages (keep-alive), responses are gzip-compressed, and
+# transient gateway errors are retried with backoff.
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    "Accept": "application/vnd.github+json",
+    "Accept-Encoding": "gzip",
+    "User-Agent": "githaul",
+})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+))
+
 def github_api_request(url: str, params=None, token: Optional[str] = None):
-    """Perform a GitHub API GET, die on failure."""
+    """Perform a GitHub API GET over the pooled session, die on failure. Returns (json, response)."""
     headers = {}
     if token:
         headers["Authorization"] = f"token {token}"
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=20)
+        resp = _SESSION.get(url, headers=headers, params=params, timeout=20)
     except Exception as e:
         fatal(f"GitHub API request failed (network): {e}")
     if resp.status_code != 200:
         fatal(f"GitHub API request failed: {resp.status_code} {resp.reason}\nURL: {url}\n{resp.text}")
-    return resp.json()
+    return resp.json(), resp
 
-def get_github_repos(user: str, org: Optional[str], token: Optional[str]) -> List[Dict]:
-    """Return list of repo metadata for a GitHub user or organization."""
+def last_page_number(resp) -> Optional[int]:
+    """Extract the final page number from a response's Link: rel=\"last\" header, if any."""
+    last_url = resp.links.get('last', {}).get('url')
+    if not last_url:
+        return None
+    try:
+        query = urllib.parse.urlparse(last_url).query
+        page_values = urllib.parse.parse_qs(query).get('page')
+        return int(page_values[0]) if page_values else None
+    except Exception:
+        # A malformed Link header just means we fall back to sequential paging.
+        return None
+
+def project_repo_fields(chunk: List[Dict]) -> List[Dict]:
+    """Keep only the fields check_repos consumes from a REST repo record.
+
+    The full record is ~5-20 KB per repo; retaining dozens of unused fields
+    wastes heap and JSON-handling time for large orgs.
+    """
+    return [
+        {'name': r['name'], 'visibility': r.get('visibility'), 'private': r.get('private')}
+        for r in chunk
+    ]
+
+_GRAPHQL_URL = "https://api.github.com/graphql"
+
+def get_github_repos_graphql(user: str, org: Optional[str], token: str) -> List[Dict]:
+    """Enumerate repos via the GraphQL API (token required).
+
+    One cursor-paginated query returns only the fields we consume (name,
+    visibility, isPrivate) instead of the full ~5-20 KB REST record per
+    repo, so payloads are a fraction of the REST size.
+    """
+    entity = "organization" if org else "user"
+    login = org if org else user
+    extra_args = "" if org else ", ownerAffiliations: OWNER"
+    query = (
+        "query($login: String!, $cursor: String) { "
+        f"{entity}(login: $login) {{ "
+        f"repositories(first: 100, after: $cursor{extra_args}) {{ "
+        "pageInfo { hasNextPage endCursor } "
+        "nodes { name visibility isPrivate } } } }"
+    )
     repos = []
-    page = 1
+    cursor = None
+    while True:
+        payload = {"query": query, "variables": {"login": login, "cursor": cursor}}
+        try:
+            resp = _SESSION.post(
+                _GRAPHQL_URL, json=payload,
+                headers={"Authorization": f"bearer {token}"}, timeout=20)
+        except Exception as e:
+            fatal(f"GitHub GraphQL request failed (network): {e}")
+        if resp.status_code != 200:
+            fatal(f"GitHub GraphQL request failed: {resp.status_code} {resp.reason}\n{resp.text}")
+        body = resp.json()
+        if body.get("errors"):
+            fatal(f"GitHub GraphQL query returned errors:\n{body['errors']}")
+        entity_data = (body.get("data") or {}).get(entity)
+        if not entity_data:
+            fatal(f"GitHub GraphQL returned no {entity} data for '{login}'")
+        connection = entity_data["repositories"]
+        for node in connection["nodes"]:
+            # Same dict shape as the REST records check_repos consumes.
+            repos.append({
+                'name': node['name'],
+                'visibility': node['visibility'].lower(),
+                'private': node['isPrivate'],
+            })
+        page_info = connection["pageInfo"]
+        if not page_info["hasNextPage"]:
+            break
+        cursor = page_info["endCursor"]
+    return repos
+
+def get_github_repos(user: str, org: Optional[str], token: Optional[str]) -> List[Dict]:
+    """Return list of repo metadata for a GitHub user or organization.
+
+    With a token, a single cursor-paginated GraphQL query is used (slimmer
+    payloads, fewer round-trips). Without one, falls back to REST: fetch
+    page 1, read the Link: rel="last" header for the total page count, then
+    fetch the remaining pages concurrently over a pooled Session
+    (keep-alive). Falls back to sequential paging when the header is absent.
+    """
+    if token:
+        return get_github_repos_graphql(user, org, token)
     if org:
-        # List org repos
-        while True:
-            url = f"https://api.github.com/orgs/{org}/repos"
-            params = {'per_page': 100, 'page': page, 'type': 'all', 'sort': 'full_name'}
-            chunk = github_api_request(url, params=params, token=token)
-            if not chunk:
-                break
-            repos.extend(chunk)
-            if len(chunk) < 100:
-                break
-            page += 1
+        url = f"https://api.github.com/orgs/{org}/repos"
+        base_params = {'per_page': 100, 'type': 'all', 'sort': 'full_name'}
     else:
-        # List user repos (owned only)
+        url = f"https://api.github.com/users/{user}/repos"
+        base_params = {'per_page': 100, 'type': 'owner', 'sort': 'full_name'}
+
+    chunk, resp = github_api_request(url, params={**base_params, 'page': 1}, token=token)
+    repos = project_repo_fields(chunk)
+    last_page = last_page_number(resp)
+
+    if last_page and last_page > 1:
+        # Remaining pages are independent GETs; fetch them in parallel.
+        def fetch_page(page: int) -> List[Dict]:
+            page_chunk, _ = github_api_request(
+                url, params={**base_params, 'page': page}, token=token)
+            return page_chunk
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for page_chunk in pool.map(fetch_page, range(2, last_page + 1)):
+                repos.extend(project_repo_fields(page_chunk))
+    elif last_page is None and len(chunk) == 100:
+        # No Link header (shouldn't happen on api.github.com, but be paranoid):
+        # keep paging sequentially until a short page.
+        page = 2
         while True:
-            url = f"https://api.github.com/users/{user}/repos"
-            params = {'per_page': 100, 'page': page, 'type': 'owner', 'sort': 'full_name'}
-            chunk = github_api_request(url, params=params, token=token)
+            chunk, _ = github_api_request(
+                url, params={**base_params, 'page': page}, token=token)
             if not chunk:
                 break
-            repos.extend(chunk)
+            repos.extend(project_repo_fields(chunk))
             if len(chunk) < 100:
                 break
             page += 1
     return repos
 
+@functools.lru_cache(maxsize=None)
+def _gitmodules_present(repo_path_str: str) -> bool:
+    """Cached stat for a repo's .gitmodules file (keyed by path string)."""
+    return (pathlib.Path(repo_path_str) / ".gitmodules").is_file()
+
 def repo_has_submodules(repo_path: pathlib.Path) -> bool:
-    """Check if repo has a .gitmodules file."""
-    return (repo_path / ".gitmodules").is_file()
+    """Check if repo has a .gitmodules file (memoized across check/display/action phases)."""
+    return _gitmodules_present(str(repo_path))
 
-def local_repo_status(repo_path: pathlib.Path, remote_url: str) -> Tuple[str, str, bool]:
+def parse_porcelain_v2(out: str) -> Tuple[str, bool, bool]:
     """
-    Analyze repo status.
-    Returns: (status_string, current_branch, has_submodules)
+    Parse `git status --porcelain=v2 --branch` output.
+    Returns: (branch, dirty, conflict)
     """
+    branch = "-"
+    dirty = False
+    conflict = False
+    for line in out.splitlines():
+        if line.startswith("# branch.head "):
+            branch = line[len("# branch.head "):].strip()
+        elif line.startswith("u "):
+            # Unmerged entry: merge conflict.
+            conflict = True
+        elif line.startswith(("1 ", "2 ", "? ")):
+            # Changed, renamed/copied, or untracked entry: local changes.
+            dirty = True
+    return branch, dirty, conflict
+
+def _local_repo_status_impl(repo_path: pathlib.Path, remote_url: str,
+                            now: Optional[datetime] = None) -> Tuple[str, str, bool, Optional[str]]:
+    """
+    Analyze repo status (full flow, no cache). `now` lets callers checking
+    many repos pay for a single clock read instead of one per repo.
+    Returns: (status_string, current_branch, has_submodules, remote_sha)
+    where remote_sha is None whenever the remote tip was not established.
+    """
+    if now is None:
+        now = datetime.now(timezone.utc)
     git_dir = repo_path / '.git'
     if not git_dir.is_dir():
-        return ("NOT PRESENT", "-", False)
-    code, out, _ = run_command(["git", "status", "--porcelain"], cwd=str(repo_path))
+        return ("NOT PRESENT", "-", False, None)
+    has_subs = repo_has_submodules(repo_path)
+    # One subprocess reports branch, dirty files, and unmerged state at once,
+    # replacing the former porcelain + rev-parse + ls-files trio.
+    code, out, _ = run_command(
+        ["git", "status", "--porcelain=v2", "--branch"], cwd=str(repo_path))
     if code != 0:
-        return ("CONFLICT", "-", repo_has_submodules(repo_path))
-    dirty = bool(out.strip())
-    code, branch, _ = run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=str(repo_path))
+        return ("CONFLICT", "-", has_subs, None)
+    branch, dirty, conflict = parse_porcelain_v2(out)
+    # A conflicted repo is reported CONFLICT regardless of remote state, so
+    # it never needs the network round-trip below.
+    if conflict:
+        return ("CONFLICT", branch, has_subs, None)
+    # One network round-trip that downloads no objects, instead of a full
+    # `git remote update` fetching every ref.
+    code, out, _ = run_command(
+        ["git", "ls-remote", "origin", f"refs/heads/{branch}"], cwd=str(repo_path))
     if code != 0:
-        return ("CONFLICT", "-", repo_has_submodules(repo_path))
-    code, _, _ = run_command(["git", "remote", "update"], cwd=str(repo_path))
-    if code != 0:
-        return ("CONFLICT", branch, repo_has_submodules(repo_path))
-    code, ahead_behind, _ = run_command(
-        ["git", "rev-list", "--left-right", "--count", "HEAD...@{u}"],
-        cwd=str(repo_path))
+        return ("CONFLICT", branch, has_subs, None)
+    remote_sha = out.split()[0] if out.strip() else ""
+    if not remote_sha:
+        # No matching branch on the remote (e.g. local-only branch): nothing to compare.
+        return ("MODIFIED" if dirty else "SYNCHRONIZED", branch, has_subs, None)
+    # The remote tip is usually already in the object store from a prior
+    # fetch; if not, pull in just that object so rev-list/log can walk it.
+    code, _, _ = run_command(
+        ["git", "cat-file", "-e", f"{remote_sha}^{{commit}}"], cwd=str(repo_path))
     if code != 0:
-        return ("MODIFIED" if dirty else "SYNCHRONIZED", branch, repo_has_submodules(repo_path))
+        run_command(["git", "fetch", "--no-tags", "origin", remote_sha], cwd=str(repo_path))
+    code, ahead_str, _ = run_command(
+        ["git", "rev-list", "--count", f"{remote_sha}..HEAD"], cwd=str(repo_path))
+    code2, behind_str, _ = run_command(
+        ["git", "rev-list", "--count", f"HEAD..{remote_sha}"], cwd=str(repo_path))
+    if code != 0 or code2 != 0:
+        return ("MODIFIED" if dirty else "SYNCHRONIZED", branch, has_subs, None)
     try:
-        behind, ahead = map(int, ahead_behind.strip().split())
+        ahead, behind = int(ahead_str), int(behind_str)
     except Exception:
         behind = ahead = 0
-    code, out, _ = run_command(["git", "ls-files", "--unmerged"], cwd=str(repo_path))
-    if code == 0 and out.strip():
-        return ("CONFLICT", branch, repo_has_submodules(repo_path))
     if dirty and (behind > 0 or ahead > 0):
-        return ("DESYNCHRONIZED", branch, repo_has_submodules(repo_path))
+        return ("DESYNCHRONIZED", branch, has_subs, remote_sha)
     if dirty:
-        return ("MODIFIED", branch, repo_has_submodules(repo_path))
+        return ("MODIFIED", branch, has_subs, remote_sha)
     if behind > 0:
         code, date_str, _ = run_command(
-            ["git", "log", "--pretty=format:%cI", "HEAD..@{u}", "-1"], cwd=str(repo_path))
+            ["git", "log", "-1", "--pretty=format:%cI", remote_sha], cwd=str(repo_path))
         if code == 0 and date_str:
             try:
-                commit_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                days_behind = (datetime.utcnow() - commit_date.replace(tzinfo=None)).days
+                # %cI is strict ISO 8601 with a numeric offset, which
+                # fromisoformat parses directly into an aware datetime.
+                commit_date = datetime.fromisoformat(date_str)
+                days_behind = (now - commit_date).days
             except Exception:
                 days_behind = 0
         else:
             days_behind = 0
         if days_behind >= 30:
-            return ("OBSOLETE", branch, repo_has_submodules(repo_path))
+            return ("OBSOLETE", branch, has_subs, remote_sha)
         else:
-            return ("OUT OF DATE", branch, repo_has_submodules(repo_path))
+            return ("OUT OF DATE", branch, has_subs, remote_sha)
     if ahead > 0:
-        return ("MODIFIED", branch, repo_has_submodules(repo_path))
-    return ("SYNCHRONIZED", branch, repo_has_submodules(repo_path))
+        return ("MODIFIED", branch, has_subs, remote_sha)
+    return ("SYNCHRONIZED", branch, has_subs, remote_sha)
 
-def check_repos(user: str, alias: str, org: Optional[str], repos: List[Dict], root_path: pathlib.Path) -> List[Dict]:
-    """Check status of all repos, return dicts for display/action."""
+def status_cache_path() -> pathlib.Path:
+    """Location of the persisted status cache (honors XDG_CACHE_HOME)."""
+    cache_home = pathlib.Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    return cache_home / "githaul" / "state.json"
+
+def load_status_cache() -> Dict:
+    """Load the persisted status cache; any problem just means starting empty."""
+    try:
+        with open(status_cache_path(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+def save_status_cache(cache: Dict) -> None:
+    """Persist the status cache; failure to write is a warning, never fatal."""
+    path = status_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except Exception as e:
+        console.print(f"[yellow]Warning: could not write status cache {path}: {e}[/yellow]")
+
+def read_git_head(repo_path: pathlib.Path) -> Tuple[Optional[str], Optional[str]]:
+    """Resolve HEAD by reading .git files directly — no subprocess.
+
+    Returns (branch, sha); branch is None on a detached HEAD. HEAD is a
+    ~50-byte file, so reading it beats a fork+exec of git rev-parse. Falls
+    back to the subprocess for layouts we cannot resolve by hand (e.g.
+    worktrees, where .git is a file).
+    """
+    git_dir = repo_path / '.git'
+    branch = None
+    try:
+        head_txt = (git_dir / 'HEAD').read_text().strip()
+    except OSError:
+        head_txt = ""
+    if head_txt.startswith('ref: refs/heads/'):
+        branch = head_txt[len('ref: refs/heads/'):]
+        # Loose ref file first, then packed-refs.
+        try:
+            return branch, (git_dir / 'refs' / 'heads' / branch).read_text().strip()
+        except OSError:
+            pass
+        try:
+            for line in (git_dir / 'packed-refs').read_text().splitlines():
+                if line.startswith(('#', '^')):
+                    continue
+                parts = line.split()
+                if len(parts) == 2 and parts[1] == f'refs/heads/{branch}':
+                    return branch, parts[0]
+        except OSError:
+            pass
+    elif head_txt and 'ref:' not in head_txt:
+        # Detached HEAD: the file holds the sha itself.
+        return None, head_txt
+    code, sha, _ = run_command(["git", "rev-parse", "HEAD"], cwd=str(repo_path))
+    if code == 0 and sha:
+        return branch, sha
+    return branch, None
+
+def repo_cache_probe(repo_path: pathlib.Path) -> Tuple[Optional[str], Optional[int]]:
+    """Cheap (HEAD sha, .git/index mtime_ns) probe used to validate cache entries."""
+    git_dir = repo_path / '.git'
+    if not git_dir.is_dir():
+        return None, None
+    try:
+        index_mtime = (git_dir / 'index').stat().st_mtime_ns
+    except OSError:
+        return None, None
+    _, head_sha = read_git_head(repo_path)
+    return head_sha, index_mtime
+
+def local_repo_status(repo_path: pathlib.Path, remote_url: str,
+                      now: Optional[datetime] = None,
+                      cache: Optional[Dict] = None) -> Tuple[str, str, bool]:
+    """
+    Analyze repo status, consulting/updating the persistent cache when given.
+    Returns: (status_string, current_branch, has_submodules)
+
+    A cache entry is only reused when the local HEAD sha, the .git/index
+    mtime, AND a fresh ls-remote of the remote tip all still match — the
+    remote is always re-probed, so a stale status is never shown for a
+    repo whose remote moved.
+    """
+    if cache is None:
+        return _local_repo_status_impl(repo_path, remote_url, now)[:3]
+    key = str(repo_path)
+    head_sha, index_mtime = repo_cache_probe(repo_path)
+    entry = cache.get(key)
+    if (isinstance(entry, dict) and head_sha and index_mtime is not None
+            and entry.get('head_sha') == head_sha
+            and entry.get('index_mtime_ns') == index_mtime
+            and entry.get('remote_sha')):
+        code, out, _ = run_command(
+            ["git", "ls-remote", "origin", f"refs/heads/{entry.get('branch')}"], cwd=key)
+        live_remote_sha = out.split()[0] if code == 0 and out.strip() else ""
+        if live_remote_sha and live_remote_sha == entry['remote_sha']:
+            # Nothing moved locally or remotely since last run: skip the
+            # porcelain/rev-list subprocesses entirely.
+            return (entry['status'], entry['branch'], entry['has_submodules'])
+    status, branch, has_subs, remote_sha = _local_repo_status_impl(repo_path, remote_url, now)
+    if head_sha and index_mtime is not None and remote_sha:
+        cache[key] = {
+            'head_sha': head_sha,
+            'index_mtime_ns': index_mtime,
+            'remote_sha': remote_sha,
+            'status': status,
+            'branch': branch,
+            'has_submodules': has_subs,
+        }
+    else:
+        # Not enough state to validate later (missing repo, conflict before
+        # the remote probe, ...): drop any stale entry rather than keep it.
+        cache.pop(key, None)
+    return (status, branch, has_subs)
+
+def check_one_repo(user: str, alias: str, org: Optional[str], repo: Dict, root_path: pathlib.Path,
+                   now: Optional[datetime] = None, cache: Optional[Dict] = None,
+                   present: bool = True) -> Dict:
+    """Compute the full status dict for a single repo (safe to run from a worker thread).
+
+    present=False is the fast negative from check_repos' one-shot root scan:
+    the repo has no local directory, so no git subprocess is needed at all.
+    """
+    repo_name = repo['name']
+    owner = org if org else user
+    remote_url = f"git@{alias}:{owner}/{repo_name}.git"
+    repo_path = root_path / repo_name
+    if present:
+        status, branch, has_submodules = local_repo_status(repo_path, remote_url, now=now, cache=cache)
+    else:
+        status, branch, has_submodules = "NOT PRESENT", "-", False
+    vis = repo.get('visibility')
+    if vis == 'internal':
+        visibility = 'RESTRICTED'
+    elif repo.get('private') or vis == 'private':
+        visibility = 'PRIVATE'
+    else:
+        visibility = 'PUBLIC'
+    return {
+        'name': repo_name,
+        'visibility': visibility,
+        'status': status,
+        'branch': branch,
+        'path': repo_path,
+        'remote_url': remote_url,
+        'has_submodules': has_submodules
+    }
+
+def check_repos(user: str, alias: str, org: Optional[str], repos: List[Dict], root_path: pathlib.Path,
+                live_title: Optional[str] = None, cache: Optional[Dict] = None) -> List[Dict]:
+    """Check status of all repos concurrently, return dicts for display/action.
+
+    Each per-repo check is dominated by blocking git subprocesses (network
+    round-trips), so a thread pool cuts wall time roughly by the pool width.
+    When live_title is given, the status table is rendered incrementally as
+    each repo resolves instead of blocking until every check finishes, so
+    the user sees progress immediately (and can Ctrl-C early).
+    """
     checked = []
+    if not repos:
+        return checked
+    # One clock read for the whole scan; every repo's days-behind math uses it.
+    now = datetime.now(timezone.utc)
+    # One scandir of the root is far cheaper than a .git stat (plus git
+    # subprocesses) per repo that was never cloned: anything without a
+    # local directory is NOT PRESENT without ever entering the pool.
+    try:
+        local_dirs = {e.name for e in os.scandir(root_path) if e.is_dir()}
+    except OSError as e:
+        fatal(f"Cannot list local root '{root_path}': {e}")
+    present_repos = []
     for repo in repos:
-        repo_name = repo['name']
-        owner = org if org else user
-        remote_url = f"git@{alias}:{owner}/{repo_name}.git"
-        repo_path = root_path / repo_name
-        status, branch, has_submodules = local_repo_status(repo_path, remote_url)
-        vis = repo.get('visibility')
-        if vis == 'internal':
-            visibility = 'RESTRICTED'
-        elif repo.get('private') or vis == 'private':
-            visibility = 'PRIVATE'
+        if repo['name'] in local_dirs:
+            present_repos.append(repo)
         else:
-            visibility = 'PUBLIC'
-        checked.append({
-            'name': repo_name,
-            'visibility': visibility,
-            'status': status,
-            'branch': branch,
-            'path': repo_path,
-            'remote_url': remote_url,
-            'has_submodules': has_submodules
-        })
+            checked.append(check_one_repo(user, alias, org, repo, root_path, now, cache, present=False))
+    if not present_repos:
+        if live_title is not None:
+            console.print(build_repos_table(checked, live_title))
+        return checked
+    max_workers = min(32, len(present_repos))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(check_one_repo, user, alias, org, repo, root_path, now, cache)
+            for repo in present_repos
+        ]
+        if live_title is None:
+            for future in as_completed(futures):
+                checked.append(future.result())
+        else:
+            with Live(build_repos_table(checked, live_title), console=console,
+                      refresh_per_second=4) as live:
+                for future in as_completed(futures):
+                    checked.append(future.result())
+                    live.update(build_repos_table(checked, live_title))
     return checked
 
+# Status -> rich color name, hoisted so the dict is built once, not per call.
+_STATUS_COLORS = {
+    "NOT PRESENT": "grey50",
+    "OUT OF DATE": "yellow",
+    "OBSOLETE": "magenta",
+    "SYNCHRONIZED": "green",
+    "MODIFIED": "yellow",
+    "CONFLICT": "red",
+    "DESYNCHRONIZED": "red"
+}
+
 def color_for_status(status: str) -> str:
     """Map status to rich color name."""
-    return {
-        "NOT PRESENT": "grey50",
-        "OUT OF DATE": "yellow",
-        "OBSOLETE": "magenta",
-        "SYNCHRONIZED": "green",
-        "MODIFIED": "yellow",
-        "CONFLICT": "red",
-        "DESYNCHRONIZED": "red"
-    }.get(status, "white")
+    return _STATUS_COLORS.get(status, "white")
 
-def display_repos_table(checked: List[Dict], title="GitHub Repository Status"):
-    """Print formatted, colorized table."""
+def build_repos_table(checked: List[Dict], title="GitHub Repository Status") -> Table:
+    """Build the formatted, colorized status table."""
     table = Table(title=title, box=box.SIMPLE_HEAVY)
     table.add_column("Repository", style="bold")
     table.add_column("VISIBILITY", style="")
@@ -267,14 +644,30 @@ def display_repos_table(checked: List[Dict], title="GitHub Repository Status"):
             f"[{color}]{item['status']}[/{color}]",
             submodules,
         )
-    console.print(table)
+    return table
 
-def get_grouped_repos(checked: List[Dict]) -> Dict[str, List[Dict]]:
-    """Group repos by status."""
-    grouped = {}
-    for item in checked:
-        grouped.setdefault(item['status'], []).append(item)
-    return grouped
+def display_repos_table(checked: List[Dict], title="GitHub Repository Status"):
+    """Print formatted, colorized table."""
+    console.print(build_repos_table(checked, title))
+
+# Which statuses feed which action group; frozensets for O(1) membership.
+_OUT_OF_DATE_STATUSES = frozenset(("OUT OF DATE", "OBSOLETE"))
+_NOT_PRESENT_STATUS = "NOT PRESENT"
+_ALWAYS_FETCH_STATUSES = frozenset(("MODIFIED", "CONFLICT", "DESYNCHRONIZED"))
+
+def partition_repos_by_action(checked: List[Dict]) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """Split repos into (need_update, need_clone, need_fetch) in one pass."""
+    need_update, need_clone, need_fetch = [], [], []
+    for r in checked:
+        status = r['status']
+        if status in _OUT_OF_DATE_STATUSES:
+            need_update.append(r)
+        elif status == _NOT_PRESENT_STATUS:
+            need_clone.append(r)
+        elif status in _ALWAYS_FETCH_STATUSES:
+            need_fetch.append(r)
+        # SYNCHRONIZED repos need no action.
+    return need_update, need_clone, need_fetch
 
 def ask_yes_no(prompt: str, default_yes=True) -> bool:
     """Prompt for yes/no, default as indicated."""
@@ -287,101 +680,128 @@ def ask_yes_no(prompt: str, default_yes=True) -> bool:
     return ans in ("y", "yes")
 
 def ensure_submodules(repo_path: pathlib.Path):
-    """Initialize and update submodules recursively if present."""
+    """Initialize and update submodules recursively if present.
+
+    --init folds the former separate `git submodule init` call into the
+    update, and --jobs=8 lets git fetch the submodules in parallel instead
+    of one at a time.
+    """
     if not repo_has_submodules(repo_path):
         return
-    code, _, err = run_command(["git", "submodule", "init"], cwd=str(repo_path))
-    if code != 0:
-        console.print(f"[yellow]Warning: git submodule init failed in {repo_path.name}: {err}[/yellow]")
-        return
-    code, _, err = run_command(["git", "submodule", "update", "--recursive"], cwd=str(repo_path))
+    code, _, err = run_command(
+        ["git", "submodule", "update", "--init", "--recursive", "--jobs=8"],
+        cwd=str(repo_path))
     if code != 0:
         console.print(f"[yellow]Warning: git submodule update failed in {repo_path.name}: {err}[/yellow]")
     else:
         console.print(f"[green]Submodules updated in {repo_path.name}[/green]")
 
+def update_one_repo(r: Dict):
+    """Fetch and (only when clean) pull a single out-of-date repo."""
+    console.print(f"\n[cyan]Updating repository {r['name']}...[/cyan]")
+    code, _, err = run_command(["git", "fetch"], cwd=str(r['path']))
+    if code != 0:
+        console.print(f"[red]git fetch failed for {r['name']}[/red]: {err}")
+        return
+    dirty = run_command_bool(["git", "status", "--porcelain"], cwd=str(r['path']))
+    conflict = run_command_bool(["git", "ls-files", "--unmerged"], cwd=str(r['path']))
+    if not dirty and not conflict:
+        code, _, err = run_command(["git", "pull"], cwd=str(r['path']))
+        if code != 0:
+            console.print(f"[red]git pull failed for {r['name']}[/red]: {err}")
+        else:
+            console.print(f"[green]Pulled latest changes for {r['name']}[/green]")
+        ensure_submodules(r['path'])
+    else:
+        if dirty:
+            console.print(f"[yellow]Skipped pull in {r['name']} due to local changes[/yellow]")
+        if conflict:
+            console.print(f"[red]Skipped pull in {r['name']} due to merge conflicts[/red]")
+        ensure_submodules(r['path'])
+
+def clone_one_repo(r: Dict):
+    """Clone a single missing repo into its destination path."""
+    dest = r['path']
+    console.print(f"\n[cyan]Cloning repository {r['name']}...[/cyan]")
+    code, _, err = run_command(["git", "clone", r['remote_url'], str(dest.parent / dest.name)])
+    if code != 0:
+        console.print(f"[red]git clone failed for {r['name']}[/red]: {err}")
+        return
+    ensure_submodules(dest)
+    console.print(f"[green]Cloned {r['name']}[/green]")
+
+def fetch_one_repo(r: Dict):
+    """Fetch (never pull) latest remote info for a single modified/conflicted repo."""
+    console.print(f"\n[yellow]Fetching latest info for {r['name']} ({r['status']})...[/yellow]")
+    code, _, err = run_command(["git", "fetch"], cwd=str(r['path']))
+    if code != 0:
+        console.print(f"[red]git fetch failed for {r['name']}[/red]: {err}")
+    else:
+        ensure_submodules(r['path'])
+        console.print(f"[green]Fetched for {r['name']}[/green]")
+
+def run_action_pipeline(tasks: List[Tuple]):
+    """Run every approved (action, repo) task in one pool behind a progress bar.
+
+    Each git fetch/clone is independent and I/O-bound; the per-repo result
+    messages render above the bar as workers finish.
+    """
+    with Progress(console=console) as progress:
+        bar = progress.add_task("Synchronizing repositories...", total=len(tasks))
+        max_workers = min(8, len(tasks))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(action, r) for action, r in tasks]
+            for future in as_completed(futures):
+                # Surface any unexpected worker exception instead of swallowing it.
+                future.result()
+                progress.advance(bar)
+
 def do_updates_and_clones(checked: List[Dict]):
-    """Prompt for and perform updates (fetch/pull) and clones as required."""
-    grouped = get_grouped_repos(checked)
-    out_of_date_statuses = ("OUT OF DATE", "OBSOLETE")
-    not_present_status = "NOT PRESENT"
-    always_fetch_statuses = ("MODIFIED", "CONFLICT", "DESYNCHRONIZED")
+    """Prompt for and perform updates (fetch/pull) and clones as required.
 
-    need_update = [r for status in out_of_date_statuses for r in grouped.get(status, [])]
+    All three groups are displayed first and all three questions asked
+    before anything executes; the approved actions then run as one
+    parallel pipeline rather than blocking the user between groups.
+    """
+    need_update, need_clone, need_fetch = partition_repos_by_action(checked)
+
+    # Show every group up front so the user sees the full picture before
+    # answering any question.
     if need_update:
         console.print("\n[bold yellow]The following repositories are out of date or obsolete:[/bold yellow]")
         for r in need_update:
             color = color_for_status(r['status'])
             console.print(f"  [{color}]{r['name']}[/{color}] ({r['status']})")
-        update_all = ask_yes_no("Update (fetch & pull) ALL out-of-date repositories?", default_yes=True)
-    else:
-        update_all = False
 
-    need_clone = grouped.get(not_present_status, [])
     if need_clone:
         console.print("\n[bold]The following repositories are not present locally:[/bold]")
         for r in need_clone:
             color = color_for_status(r['status'])
             console.print(f"  [{color}]{r['name']}[/{color}]")
-        clone_all = ask_yes_no("Clone ALL missing repositories?", default_yes=True)
-    else:
-        clone_all = False
 
-    need_fetch = [r for status in always_fetch_statuses for r in grouped.get(status, [])]
     if need_fetch:
         console.print("\n[bold red]The following repositories have local changes/conflicts:[/bold red]")
         for r in need_fetch:
             color = color_for_status(r['status'])
             console.print(f"  [{color}]{r['name']}[/{color}] ({r['status']})")
-        fetch_all = ask_yes_no("Fetch latest info for ALL modified/conflicted repositories? (never pulls, never overwrites)", default_yes=True)
-    else:
-        fetch_all = False
-
-    for r in need_update:
-        if update_all:
-            console.print(f"\n[cyan]Updating repository {r['name']}...[/cyan]")
-            code, _, err = run_command(["git", "fetch"], cwd=str(r['path']))
-            if code != 0:
-                console.print(f"[red]git fetch failed for {r['name']}[/red]: {err}")
-                continue
-            code, out, _ = run_command(["git", "status", "--porcelain"], cwd=str(r['path']))
-            dirty = bool(out.strip())
-            code, out, _ = run_command(["git", "ls-files", "--unmerged"], cwd=str(r['path']))
-            conflict = bool(out.strip())
-            if not dirty and not conflict:
-                code, _, err = run_command(["git", "pull"], cwd=str(r['path']))
-                if code != 0:
-                    console.print(f"[red]git pull failed for {r['name']}[/red]: {err}")
-                else:
-                    console.print(f"[green]Pulled latest changes for {r['name']}[/green]")
-                ensure_submodules(r['path'])
-            else:
-                if dirty:
-                    console.print(f"[yellow]Skipped pull in {r['name']} due to local changes[/yellow]")
-                if conflict:
-                    console.print(f"[red]Skipped pull in {r['name']} due to merge conflicts[/red]")
-                ensure_submodules(r['path'])
-
-    for r in need_clone:
-        if clone_all:
-            dest = r['path']
-            console.print(f"\n[cyan]Cloning repository {r['name']}...[/cyan]")
-            code, _, err = run_command(["git", "clone", r['remote_url'], str(dest.parent / dest.name)])
-            if code != 0:
-                console.print(f"[red]git clone failed for {r['name']}[/red]: {err}")
-                continue
-            ensure_submodules(dest)
-            console.print(f"[green]Cloned {r['name']}[/green]")
-
-    for r in need_fetch:
-        if fetch_all:
-            console.print(f"\n[yellow]Fetching latest info for {r['name']} ({r['status']})...[/yellow]")
-            code, _, err = run_command(["git", "fetch"], cwd=str(r['path']))
-            if code != 0:
-                console.print(f"[red]git fetch failed for {r['name']}[/red]: {err}")
-            else:
-                ensure_submodules(r['path'])
-                console.print(f"[green]Fetched for {r['name']}[/green]")
+
+    # One question per group, all answered before any action starts.
+    update_all = need_update and ask_yes_no(
+        "Update (fetch & pull) ALL out-of-date repositories?", default_yes=True)
+    clone_all = need_clone and ask_yes_no(
+        "Clone ALL missing repositories?", default_yes=True)
+    fetch_all = need_fetch and ask_yes_no(
+        "Fetch latest info for ALL modified/conflicted repositories? (never pulls, never overwrites)", default_yes=True)
+
+    tasks = []
+    if update_all:
+        tasks.extend((update_one_repo, r) for r in need_update)
+    if clone_all:
+        tasks.extend((clone_one_repo, r) for r in need_clone)
+    if fetch_all:
+        tasks.extend((fetch_one_repo, r) for r in need_fetch)
+    if tasks:
+        run_action_pipeline(tasks)
 
 def main():
     """Main entry point, with full org/user parsing and CLI error logic."""
@@ -437,19 +857,24 @@ def main():
     repos = get_github_repos(user, org, token)
     if not repos:
         fatal("No repositories found for this user or organization.")
-    checked = check_repos(user, alias, org, repos, root_path)
+    # Load the persistent status cache so unchanged repos skip their git calls.
+    status_cache = load_status_cache()
 
-    # Upfront grouped status display
+    # Upfront grouped status display, streamed as each repo's check resolves
     console.print("\n[bold underline]Initial Repository Status Summary[/bold underline]")
-    display_repos_table(checked)
+    checked = check_repos(user, alias, org, repos, root_path,
+                          live_title="GitHub Repository Status", cache=status_cache)
 
     # All grouped prompts and actions
     do_updates_and_clones(checked)
 
-    # Post-action status table
+    # Post-action status table. Clones/pulls may have introduced .gitmodules
+    # files, so drop the memoized stats before re-checking.
+    _gitmodules_present.cache_clear()
     console.print("\n[bold green]Post-Action Repository Status Summary[/bold green]")
-    checked_post = check_repos(user, alias, org, repos, root_path)
-    display_repos_table(checked_post)
+    check_repos(user, alias, org, repos, root_path,
+                live_title="GitHub Repository Status", cache=status_cache)
+    save_status_cache(status_cache)
 
     console.print("\n[bold green]All done.[/bold green]")
 
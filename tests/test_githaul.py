@@ -20,6 +20,88 @@ def test_parse_org_user_alias_org_prefix():
     assert alias == "gh"
 
 
+class FakeResponse:
+    def __init__(self, links):
+        self.links = links
+
+
+def test_last_page_number_parses_link_header():
+    resp = FakeResponse({'last': {'url': 'https://api.github.com/orgs/Acme/repos?per_page=100&page=7'}})
+    assert githaul.last_page_number(resp) == 7
+
+
+def test_last_page_number_missing_link_header():
+    assert githaul.last_page_number(FakeResponse({})) is None
+
+
+def test_parse_porcelain_v2_clean():
+    out = "# branch.oid abc123\n# branch.head main\n# branch.upstream origin/main"
+    branch, dirty, conflict = githaul.parse_porcelain_v2(out)
+    assert branch == "main"
+    assert dirty is False
+    assert conflict is False
+
+
+def test_parse_porcelain_v2_dirty_and_conflict():
+    out = (
+        "# branch.head feature\n"
+        "1 .M N... 100644 100644 100644 abc def file.py\n"
+        "u UU N... 100644 100644 100644 100644 abc def ghi clash.py\n"
+        "? newfile.txt"
+    )
+    branch, dirty, conflict = githaul.parse_porcelain_v2(out)
+    assert branch == "feature"
+    assert dirty is True
+    assert conflict is True
+
+
+def test_partition_repos_by_action():
+    checked = [
+        {'name': 'a', 'status': 'OUT OF DATE'},
+        {'name': 'b', 'status': 'OBSOLETE'},
+        {'name': 'c', 'status': 'NOT PRESENT'},
+        {'name': 'd', 'status': 'MODIFIED'},
+        {'name': 'e', 'status': 'CONFLICT'},
+        {'name': 'f', 'status': 'SYNCHRONIZED'},
+    ]
+    need_update, need_clone, need_fetch = githaul.partition_repos_by_action(checked)
+    assert [r['name'] for r in need_update] == ['a', 'b']
+    assert [r['name'] for r in need_clone] == ['c']
+    assert [r['name'] for r in need_fetch] == ['d', 'e']
+
+
+def test_read_git_head_loose_ref(tmp_path):
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "refs" / "heads" / "main").write_text("a" * 40 + "\n")
+    branch, sha = githaul.read_git_head(tmp_path)
+    assert branch == "main"
+    assert sha == "a" * 40
+
+
+def test_read_git_head_packed_ref(tmp_path):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("ref: refs/heads/dev\n")
+    (git_dir / "packed-refs").write_text(
+        "# pack-refs with: peeled fully-peeled sorted\n"
+        + "b" * 40 + " refs/heads/dev\n"
+    )
+    branch, sha = githaul.read_git_head(tmp_path)
+    assert branch == "dev"
+    assert sha == "b" * 40
+
+
+def test_read_git_head_detached(tmp_path):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    (git_dir / "HEAD").write_text("c" * 40 + "\n")
+    branch, sha = githaul.read_git_head(tmp_path)
+    assert branch is None
+    assert sha == "c" * 40
+
+
 def test_display_table_has_visibility_column():
     githaul.console = Console(record=True)
     sample = [{